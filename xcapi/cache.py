@@ -0,0 +1,182 @@
+"""
+On-disk cache for Xeno-canto API responses.
+
+Stores gzipped JSON entries keyed by a hash of the request, so repeated
+searches can be answered without going back to the API.
+"""
+
+import gzip
+import hashlib
+import json
+import math
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+DEFAULT_CACHE_DIR = Path(os.getenv('XDG_CACHE_HOME', Path.home() / '.cache')) / 'xcapi'
+
+
+class DiskCache:
+    """
+    A directory of gzipped JSON entries that expire after a TTL.
+
+    Each entry stores the cached value together with the time it was
+    stored, a revalidation factor and, optionally, the ETag the server
+    sent with it. An entry stays fresh for the cache's current TTL times
+    its factor (up to MAX_TTL, or the TTL itself if that is longer), so
+    changing the TTL applies to existing entries too. An expired entry
+    that has an ETag can be revalidated with the server instead of
+    re-fetched; every successful revalidation doubles its factor, so data
+    that rarely changes is checked less and less often.
+
+    Read and write errors are never raised to the caller: a broken entry
+    behaves like a cache miss.
+
+    Example:
+        >>> cache = DiskCache(ttl=3600)
+        >>> key = DiskCache.make_key("gen:Larus", 1, 100)
+        >>> cache.set(key, {"recordings": []})
+        >>> cache.get(key)
+        {'recordings': []}
+    """
+
+    # Upper bound for TTLs extended by revalidation (24 hours)
+    MAX_TTL = 24 * 60 * 60
+
+    def __init__(self, cache_dir: Optional[str] = None, ttl: float = 3600):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for cache entries (default: ~/.cache/xcapi)
+            ttl: Number of seconds a new entry stays fresh (default: 3600)
+
+        Raises:
+            ValueError: If ttl is not positive
+        """
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.ttl = ttl
+
+    @staticmethod
+    def make_key(*parts) -> str:
+        """
+        Build a cache key from the given request parts.
+
+        Args:
+            *parts: Values identifying the request (e.g. query, page, per_page)
+
+        Returns:
+            Hex digest usable as a file name
+        """
+        raw = '|'.join(str(part) for part in parts)
+        return hashlib.blake2b(raw.encode('utf-8'), digest_size=20).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Return the cached value for key, or None if missing or expired.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            The decoded JSON value, or None
+        """
+        entry = self.get_entry(key)
+        if entry is None or not self.is_fresh(entry):
+            return None
+        return entry['body']
+
+    def get_entry(self, key: str) -> Optional[Dict]:
+        """
+        Return the stored entry for key, whether or not it has expired.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Dictionary with 'body', 'etag', 'ts' and 'factor', or None
+        """
+        try:
+            with gzip.open(self._path(key), 'rt', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or not {'body', 'ts', 'factor'} <= entry.keys():
+            return None
+        return entry
+
+    def is_fresh(self, entry: Dict) -> bool:
+        """
+        Return whether an entry from get_entry() is still within its TTL.
+
+        Args:
+            entry: Cache entry
+
+        Returns:
+            True if the entry has not expired
+        """
+        lifetime = min(self.ttl * entry['factor'], self._max_lifetime())
+        return time.time() - entry['ts'] <= lifetime
+
+    def set(self, key: str, value: Any, etag: Optional[str] = None):
+        """
+        Store a JSON-serializable value under key with the base TTL.
+
+        Args:
+            key: Cache key from make_key()
+            value: JSON-serializable value
+            etag: ETag the server sent with the value, if any
+        """
+        self._write(key, {'body': value, 'etag': etag, 'ts': time.time(), 'factor': 1})
+
+    def revalidated(self, key: str, entry: Dict):
+        """
+        Mark an expired entry as confirmed unchanged by the server.
+
+        Restarts the entry's lifetime and doubles its revalidation factor,
+        up to the factor at which the lifetime reaches MAX_TTL.
+
+        Args:
+            key: Cache key from make_key()
+            entry: Entry previously returned by get_entry()
+        """
+        factor = min(entry['factor'] * 2, max(1, math.ceil(self._max_lifetime() / self.ttl)))
+        self._write(key, dict(entry, ts=time.time(), factor=factor))
+
+    def _max_lifetime(self) -> float:
+        """Return the longest time an entry can stay fresh (MAX_TTL, or the TTL if longer)."""
+        return max(self.MAX_TTL, self.ttl)
+
+    def _write(self, key: str, entry: Dict):
+        """
+        Write an entry to disk.
+
+        The entry is written to a temporary file and moved into place, so
+        concurrent readers never see a partially written entry.
+
+        Args:
+            key: Cache key from make_key()
+            entry: Entry to store
+        """
+        path = self._path(key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
+    def _path(self, key: str) -> Path:
+        """Return the file path for a cache key."""
+        return self.cache_dir / f"{key}.json.gz"
@@ -5,8 +5,13 @@ Provides a comprehensive CLI for searching and downloading Xeno-canto recordings
 """
 
 import argparse
+import functools
+import itertools
 import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 from xcapi.query import QueryBuilder
 from xcapi.client import XenoCantoClient
 from xcapi.downloader import Downloader
@@ -14,12 +19,68 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
-def main():
-    """Main entry point for the xcapi CLI."""
-    parser = argparse.ArgumentParser(
-        description='Download animal sound recordings from Xeno-canto',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+# Search filter arguments, grouped as shown in --help. Each entry is
+# (flags, help[, extra add_argument options]); the first flag without its
+# dashes is both the argparse dest and the Xeno-canto search tag.
+_FILTER_ARGS = (
+    ('Taxonomic filters', (
+        (('--gen', '--genus'), 'Genus name (e.g., Corvus)'),
+        (('--sp', '--species'), 'Species name (e.g., "Pica pica"). To perform a search for a species name that has multiple words, you must enclose the words in double quotes.'),
+        (('--ssp', '--subspecies'), 'Subspecies name. To perform a search for a subspecies name that has multiple words, you must enclose the words in double quotes.'),
+        (('--en', '--english'), 'English common name (e.g., "Common blackbird"). To perform a search for a common name that has multiple words, you must enclose the words in double quotes.'),
+        (('--fam', '--family'), 'Family name. To perform a search for a family name that has multiple words, you must enclose the words in double quotes.'),
+        (('--grp', '--group'), 'Taxonomic group (e.g., birds, grasshoppers, bats, frogs, land mammals, soundscape). To perform a search for a taxonomic group that has multiple words, you must enclose the words in double quotes (e.g., --grp "land mammals").'),
+    )),
+    ('Geographic filters', (
+        (('--cnt', '--country'), 'Country name (e.g., Germany). To perform a search for a country that has multiple words, you must enclose the words in double quotes (e.g., --cnt "Costa Rica")'),
+        (('--loc', '--location'), 'Locality or site name (e.g., tambopata). To perform a search for a location that has multiple words, you must enclose the words in double quotes (e.g., --loc "New Delhi")'),
+        (('--area',), 'Continent or region (e.g., Europe, Asia, Africa)'),
+        (('--box',), 'Bounding box as lat_min,lon_min,lat_max,lon_max'),
+        (('--lat', '--latitude'), 'Latitude or range (e.g., 40-45, ">50"). Quotes are required in most shells for < or >.'),
+        (('--lon', '--longitude'), 'Longitude or range (e.g., -10-0, "<-100"). Quotes are required in most shells for < or >.'),
+        (('--alt', '--altitude'), 'Altitude in meters (e.g., 100-500, "<1000"). Quotes are required in most shells for < or >.'),
+    )),
+    ('Quality and type filters', (
+        (('--q', '--quality'), 'Recording quality rating (A–E). Supports operators like A, ">B" or "<C". Quotes are required in most shells for < or >, e.g. --q ">B".'),
+        (('--type',), 'Sound type (e.g., song, call, alarm, etc.)'),
+        (('--sex',), 'Sex (male, female)'),
+        (('--stage',), 'Life stage (adult, juvenile, etc.)'),
+        (('--method',), 'Recording method'),
+    )),
+    ('Time filters', (
+        (('--year',), 'Year or range (e.g., 2020, 2015-2020). Quotes are required in most shells for < or > (e.g., --year ">2020").'),
+        (('--month',), 'Month or range (e.g., 6, 1-7). Quotes are required in most shells for < or > (e.g., --month "<5")'),
+        (('--since',), 'Recordings uploaded since YYYY-MM-DD (e.g., 2012-11-09) or within last N days (e.g., 2, 3)'),
+        (('--time',), 'Time of day or range (e.g., 06:00, 06:00-12:00)'),
+    )),
+    ('Other filters', (
+        (('--rec', '--recordist'), 'Recordist name (e.g., "Raziya"). To perform a search for a location that has multiple words, you must enclose the words in double quotes (e.g., "Raziya Qadri")'),
+        (('--len', '--length'), 'Recording length in seconds (e.g., 10, 20, 10-20, "<30", ">60"). Ranges and comparison operators are supported. Quotes are required in most shells for < or >.'),
+        (('--lic', '--license'), 'License type (e.g., CC-BY, CC0)'),
+        (('--also',), 'Background species name. To perform a search for a background species name that has multiple words, you must enclose the words in double quotes.'),
+        (('--seen',), 'Was the animal seen? (yes/no)', {'choices': ['yes', 'no']}),
+        (('--playback',), 'Was playback used? (yes/no)', {'choices': ['yes', 'no']}),
+    )),
+    ('Recording metadata filters', (
+        (('--nr', '--recording_number'), 'XC recording number or range (e.g. 76967, 88888-88890, ">76960"). Quotes are required in most shells for < or >.'),
+        (('--temp', '--temperature'), 'Temperature in °C (e.g., 20-30, "<10", ">35"). Quotes are required in most shells for < or >.'),
+        (('--regnr',), 'Specimen registration number'),
+        (('--auto', '--automatic'), 'Automatic (non-supervised) recording', {'choices': ['yes', 'no', 'unknown']}),
+        (('--dvc', '--device'), 'Recording device (e.g., "Zoom F3"). To perform a search for a recording device that has multiple words, you must enclose the words in double quotes.'),
+        (('--mic', '--microphone'), 'Microphone model. To perform a search for a microphone model that has multiple words, you must enclose the words in double quotes.'),
+        (('--smp', '--sample_rate'), 'Sample rate or a range in Hz (e.g., 44100, 44100-100000, ">44100"). Quotes are required in most shells for < or >.'),
+        (('--rmk', '--remarks'), 'Search in remarks field text'),
+    )),
+)
+
+# argparse dest of every search filter, in query order (each is also its tag)
+_FILTER_DESTS = tuple(
+    flags[0].lstrip('-') for _, filter_args in _FILTER_ARGS for flags, *_ in filter_args
+)
+
+
+# Usage examples shown at the end of --help
+_EPILOG = """
 Examples:
   # Download Orthoptera from Europe
   xcapi --grp Orthoptera --area europe --output_dir ./data
@@ -33,6 +94,9 @@ Examples:
   # Download recent recordings from last 30 days
   xcapi --grp birds --since 30
 
+  # Download from several countries in one run (one search per country)
+  xcapi --grp birds --cnt Spain,Portugal --type song
+
   # Preview what a download would add without downloading audio
   xcapi --grp birds --cnt Spain --metadata_only
 
@@ -42,6 +106,22 @@ Examples:
 Environment Variables:
   XENO_CANTO_API_KEY   Your Xeno-canto API key (required)
         """
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """
+    Build the argument parser for the xcapi CLI.
+
+    The parser is built once and reused by later calls.
+
+    Returns:
+        The configured ArgumentParser
+    """
+    parser = argparse.ArgumentParser(
+        description='Download animal sound recordings from Xeno-canto',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG
     )
 
     parser.add_argument(
@@ -64,8 +144,26 @@ Environment Variables:
     parser.add_argument(
         '--per_page',
         type=int,
-        default=100,
-        help='Results per page (50-500, default: 100)'
+        default=500,
+        help='Results per page (50-500, default: 500, the API maximum, which needs the fewest requests)'
+    )
+
+    parser.add_argument(
+        '--max_workers',
+        type=int,
+        default=8,
+        help='Number of recordings to download concurrently (default: 8)'
+    )
+
+    parser.add_argument(
+        '--parallel',
+        type=int,
+        default=1,
+        metavar='N',
+        help=(
+            'Split a --year range (e.g. 2010-2020) into N sub-ranges and search them concurrently. '
+            'Has no effect without an explicit year range (default: 1)'
+        )
     )
 
     parser.add_argument(
@@ -78,6 +176,35 @@ Environment Variables:
         )
     )
 
+    parser.add_argument(
+        '--dedupe',
+        action='store_true',
+        help=(
+            'Keep a SHA-256 index of downloaded audio (.xcapi_index) and replace files whose '
+            'content was already downloaded with hard links, so identical audio is stored once'
+        )
+    )
+
+    parser.add_argument(
+        '--force_refresh',
+        action='store_true',
+        help='Ignore cached search results and fetch fresh pages from the API'
+    )
+
+    parser.add_argument(
+        '--cache_ttl',
+        type=float,
+        default=3600,
+        metavar='SECONDS',
+        help='Seconds a cached page of search results is reused without asking the API (default: 3600)'
+    )
+
+    parser.add_argument(
+        '--no_cache',
+        action='store_true',
+        help='Neither read nor write the on-disk search cache'
+    )
+
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
@@ -94,123 +221,92 @@ Environment Variables:
         )
     )
 
-    tax_group = parser.add_argument_group('Taxonomic filters')
-    tax_group.add_argument('--gen', '--genus', help='Genus name (e.g., Corvus)')
-    tax_group.add_argument('--sp', '--species', help='Species name (e.g., "Pica pica"). To perform a search for a species name that has multiple words, you must enclose the words in double quotes.')
-    tax_group.add_argument('--ssp', '--subspecies', help='Subspecies name. To perform a search for a subspecies name that has multiple words, you must enclose the words in double quotes.')
-    tax_group.add_argument('--en', '--english', help='English common name (e.g., "Common blackbird"). To perform a search for a common name that has multiple words, you must enclose the words in double quotes.')
-    tax_group.add_argument('--fam', '--family', help='Family name. To perform a search for a family name that has multiple words, you must enclose the words in double quotes.')
-    tax_group.add_argument('--grp', '--group', help='Taxonomic group (e.g., birds, grasshoppers, bats, frogs, land mammals, soundscape). To perform a search for a taxonomic group that has multiple words, you must enclose the words in double quotes (e.g., --grp "land mammals").')
-
-    geo_group = parser.add_argument_group('Geographic filters')
-    geo_group.add_argument('--cnt', '--country', help='Country name (e.g., Germany). To perform a search for a country that has multiple words, you must enclose the words in double quotes (e.g., --cnt "Costa Rica")')
-    geo_group.add_argument('--loc', '--location', help='Locality or site name (e.g., tambopata). To perform a search for a location that has multiple words, you must enclose the words in double quotes (e.g., --loc "New Delhi")')
-    geo_group.add_argument('--area', help='Continent or region (e.g., Europe, Asia, Africa)')
-    geo_group.add_argument('--box', help='Bounding box as lat_min,lon_min,lat_max,lon_max')
-    geo_group.add_argument('--lat', '--latitude', help='Latitude or range (e.g., 40-45, ">50"). Quotes are required in most shells for < or >.')
-    geo_group.add_argument('--lon', '--longitude', help='Longitude or range (e.g., -10-0, "<-100"). Quotes are required in most shells for < or >.')
-    geo_group.add_argument('--alt', '--altitude', help='Altitude in meters (e.g., 100-500, "<1000"). Quotes are required in most shells for < or >.')
-
-    quality_group = parser.add_argument_group('Quality and type filters')
-    quality_group.add_argument(
-        '--q', '--quality',
-        help='Recording quality rating (A–E). Supports operators like A, ">B" or "<C". '
-             'Quotes are required in most shells for < or >, e.g. --q ">B".'
-    )
-    quality_group.add_argument('--type', help='Sound type (e.g., song, call, alarm, etc.)')
-    quality_group.add_argument('--sex', help='Sex (male, female)')
-    quality_group.add_argument('--stage', help='Life stage (adult, juvenile, etc.)')
-    quality_group.add_argument('--method', help='Recording method')
-
-    time_group = parser.add_argument_group('Time filters')
-    time_group.add_argument('--year', help='Year or range (e.g., 2020, 2015-2020). Quotes are required in most shells for < or > (e.g., --year ">2020").')
-    time_group.add_argument('--month', help='Month or range (e.g., 6, 1-7). Quotes are required in most shells for < or > (e.g., --month "<5")')
-    time_group.add_argument('--since', help='Recordings uploaded since YYYY-MM-DD (e.g., 2012-11-09) or within last N days (e.g., 2, 3)')
-    time_group.add_argument('--time', help='Time of day or range (e.g., 06:00, 06:00-12:00)')
-
-    other_group = parser.add_argument_group('Other filters')
-    other_group.add_argument('--rec', '--recordist', help='Recordist name (e.g., "Raziya"). To perform a search for a location that has multiple words, you must enclose the words in double quotes (e.g., "Raziya Qadri")')
-    other_group.add_argument(
-        '--len', '--length',
-        help='Recording length in seconds (e.g., 10, 20, 10-20, "<30", ">60"). '
-             'Ranges and comparison operators are supported. Quotes are required in most shells for < or >.'
-    )
-    other_group.add_argument('--lic', '--license', help='License type (e.g., CC-BY, CC0)')
-    other_group.add_argument('--also', help='Background species name. To perform a search for a background species name that has multiple words, you must enclose the words in double quotes.')
-    other_group.add_argument('--seen', choices=['yes', 'no'], help='Was the animal seen? (yes/no)')
-    other_group.add_argument('--playback', choices=['yes', 'no'], help='Was playback used? (yes/no)')
-
-    metadata_group = parser.add_argument_group('Recording metadata filters')
-    metadata_group.add_argument(
-        '--nr', '--recording_number',
-        help='XC recording number or range (e.g. 76967, 88888-88890, ">76960"). Quotes are required in most shells for < or >.'
-    )
-    metadata_group.add_argument(
-        '--temp', '--temperature',
-        help='Temperature in °C (e.g., 20-30, "<10", ">35"). Quotes are required in most shells for < or >.'
-    )
-    metadata_group.add_argument('--regnr', help='Specimen registration number')
-    metadata_group.add_argument(
-        '--auto', '--automatic', choices=['yes', 'no', 'unknown'],
-        help='Automatic (non-supervised) recording'
-    )
-    metadata_group.add_argument('--dvc', '--device', help='Recording device (e.g., "Zoom F3"). To perform a search for a recording device that has multiple words, you must enclose the words in double quotes.')
-    metadata_group.add_argument('--mic', '--microphone', help='Microphone model. To perform a search for a microphone model that has multiple words, you must enclose the words in double quotes.')
-    metadata_group.add_argument('--smp', '--sample_rate',
-                                help='Sample rate or a range in Hz (e.g., 44100, 44100-100000, ">44100"). Quotes are required in most shells for < or >.')
-    metadata_group.add_argument('--rmk', '--remarks', help='Search in remarks field text')
+    for title, filter_args in _FILTER_ARGS:
+        group = parser.add_argument_group(title)
+        for flags, help_text, *options in filter_args:
+            options = options[0] if options else {}
+            group.add_argument(*flags, dest=flags[0].lstrip('-'), help=help_text, **options)
 
+    return parser
+
+
+def main():
+    """Main entry point for the xcapi CLI."""
+    parser = _build_parser()
     args = parser.parse_args()
 
-    try:
-        query = build_query_from_args(args)
+    if not any(getattr(args, dest, None) for dest in _FILTER_DESTS):
+        parser.error("No search filters specified. Use --help for available options.")
 
-        if not query:
-            parser.error("No search filters specified. Use --help for available options.")
+    try:
+        queries = build_queries_from_args(args)
 
         if args.verbose:
-            print(f"Query: {query}\n")
+            print("\n".join(f"Query: {query}" for query in queries) + "\n")
 
         api_key = args.api_key or os.getenv('XENO_CANTO_API_KEY')
         if not api_key:
             print("ERROR: API key required. Set XENO_CANTO_API_KEY environment variable or use --api_key", file=sys.stderr)
             sys.exit(1)
 
-        with XenoCantoClient(api_key=api_key) as client:
+        cache_ttl = 0 if args.no_cache else args.cache_ttl
+        with XenoCantoClient(api_key=api_key, cache_ttl=cache_ttl, force_refresh=args.force_refresh) as client:
             print("Searching for recordings...")
-            recordings = client.search(
-                query=query,
-                per_page=args.per_page,
-                max_results=args.max_results,
-                verbose=args.verbose
-            )
-
-            if not recordings:
+            if len(queries) > 1:
+                if args.verbose:
+                    print(f"Searching {len(queries)} queries in parallel")
+                recordings = search_parallel(client, queries, args.per_page, args.max_results)
+                total = len(recordings)
+            else:
+                query = queries[0]
+                # Later pages are fetched while earlier recordings download.
+                # iter_search() validates its arguments now but fetches
+                # nothing until iterated, so this runs before any request.
+                recordings = client.iter_search(
+                    query=query,
+                    per_page=args.per_page,
+                    max_results=args.max_results,
+                    verbose=args.verbose
+                )
+                # The first page carries the total; iter_search() reuses it
+                # from the client's first-page cache instead of fetching again
+                metadata = client.get_metadata(query, per_page=args.per_page)
+                total = int(metadata['numRecordings'] or 0)
+                if args.max_results:
+                    total = min(total, args.max_results)
+
+            if not total:
                 print("No recordings found matching the query.")
                 return
 
-            print(f"\nFound {len(recordings)} recordings.")
-
-            downloader = Downloader(output_dir=args.output_dir)
-
-            if args.metadata_only:
-                print(f"Saving metadata delta to: {downloader.output_dir}\n")
-                downloader.save_metadata_only(recordings, verbose=True)
-                print("\n✓ Done! Run without --metadata_only to download the audio files.")
-                return
-
-            print(f"Downloading to: {downloader.output_dir}\n")
-
-            stats = downloader.download_recordings(
-                recordings=recordings,
-                verbose=args.verbose,
-                redownload=args.redownload
-            )
-
-            print("\n✓ Download complete!")
-            print(f"  Downloaded: {stats['downloaded']}")
-            print(f"  Skipped:    {stats['skipped']}")
-            print(f"  Failed:     {stats['failed']}")
+            print(f"\nFound {total} recordings.")
+
+            with Downloader(
+                output_dir=args.output_dir,
+                max_workers=args.max_workers,
+                dedupe=args.dedupe
+            ) as downloader:
+                if args.metadata_only:
+                    print(f"Saving metadata delta to: {downloader.output_dir}\n")
+                    downloader.save_metadata_only(recordings, verbose=True)
+                    print("\n✓ Done! Run without --metadata_only to download the audio files.")
+                    return
+
+                print(f"Downloading to: {downloader.output_dir}\n")
+
+                stats = downloader.download_recordings(
+                    recordings=recordings,
+                    total=total,
+                    verbose=args.verbose,
+                    redownload=args.redownload
+                )
+
+                print("\n✓ Download complete!")
+                print(f"  Downloaded: {stats['downloaded']}")
+                print(f"  Skipped:    {stats['skipped']}")
+                print(f"  Failed:     {stats['failed']}")
+                if args.dedupe:
+                    print(f"  Linked:     {stats['linked']}")
 
     except KeyboardInterrupt:
         print("\n\nDownload interrupted by user.", file=sys.stderr)
@@ -223,6 +319,57 @@ Environment Variables:
         sys.exit(1)
 
 
+def _bounding_box_value(value: str) -> str:
+    """Parse a lat_min,lon_min,lat_max,lon_max argument into a box tag value."""
+    # Count the fields before converting any of them; float() strips
+    # surrounding whitespace itself
+    parts = value.split(',')
+    try:
+        if len(parts) != 4:
+            raise ValueError("Box must have 4 coordinates")
+        return ','.join([str(float(part)) for part in parts])
+    except ValueError as e:
+        raise ValueError(f"Invalid bounding box format: {e}")
+
+
+# Explicit year range such as 2010-2020, which --parallel can split
+_YEAR_RANGE_RE = re.compile(r'(\d{4})-(\d{4})')
+
+# Tags that accept a comma-separated list of values (e.g. --cnt Spain,France).
+# Free-text tags such as loc or rmk are left out, as their values may
+# legitimately contain commas.
+_MULTI_VALUE_TAGS = frozenset({
+    'gen', 'sp', 'ssp', 'en', 'fam', 'grp', 'cnt', 'area', 'type', 'sex', 'stage'
+})
+
+
+# Arguments whose value needs converting before it becomes a tag value
+_ARG_HANDLERS = {
+    'box': _bounding_box_value,
+}
+
+
+def query_tags_from_args(args) -> Dict[str, str]:
+    """
+    Collect search tags from command-line arguments.
+
+    Args:
+        args: Parsed command-line arguments
+
+    Returns:
+        Mapping of search tag to value, in query order
+    """
+    tags = {}
+    for dest in _FILTER_DESTS:
+        value = getattr(args, dest, None)
+        if not value:
+            continue
+
+        handler = _ARG_HANDLERS.get(dest)
+        tags[dest] = handler(value) if handler is not None else str(value)
+    return tags
+
+
 def build_query_from_args(args) -> str:
     """
     Build a query string from command-line arguments.
@@ -233,93 +380,113 @@ def build_query_from_args(args) -> str:
     Returns:
         Query string for the Xeno-canto API
     """
-    builder = QueryBuilder()
-
-    if args.gen:
-        builder.genus(args.gen)
-    if args.sp:
-        builder.species(args.sp)
-    if args.ssp:
-        builder.subspecies(args.ssp)
-    if args.fam:
-        builder.family(args.fam)
-    if args.grp:
-        builder.group(args.grp)
-    if args.en:
-        builder.english_name(args.en)
-
-    if args.cnt:
-        builder.country(args.cnt)
-    if args.loc:
-        builder.location(args.loc)
-    if args.area:
-        builder.area(args.area)
-    if args.box:
-        try:
-            coords = [float(x.strip()) for x in args.box.split(',')]
-            if len(coords) != 4:
-                raise ValueError("Box must have 4 coordinates")
-            builder.bounding_box(*coords)
-        except ValueError as e:
-            raise ValueError(f"Invalid bounding box format: {e}")
-    if args.lat:
-        builder.latitude(args.lat)
-    if args.lon:
-        builder.longitude(args.lon)
-    if args.alt:
-        builder.altitude(args.alt)
-
-    if args.q:
-        builder.quality(args.q)
-    if args.type:
-        builder.sound_type(args.type)
-    if args.sex:
-        builder.sex(args.sex)
-    if args.stage:
-        builder.life_stage(args.stage)
-    if args.method:
-        builder.method(args.method)
-
-    if args.year:
-        builder.year(args.year)
-    if args.month:
-        builder.month(args.month)
-    if args.since:
-        builder.since(args.since)
-    if args.time:
-        builder.time_of_day(args.time)
-
-    if args.rec:
-        builder.recordist(args.rec)
-    if getattr(args, 'len', None):
-        builder.length(args.len)
-    if args.lic:
-        builder.license(args.lic)
-    if args.also:
-        builder.also(args.also)
-    if args.seen:
-        builder.animal_seen(args.seen == 'yes')
-    if args.playback:
-        builder.playback_used(args.playback == 'yes')
-
-    if args.nr:
-        builder.xc_number(args.nr)
-    if args.temp:
-        builder.temperature(args.temp)
-    if args.regnr:
-        builder.registration_number(args.regnr)
-    if args.auto:
-        builder.automatic_recording(args.auto)
-    if args.dvc:
-        builder.device(args.dvc)
-    if args.mic:
-        builder.microphone(args.mic)
-    if args.smp:
-        builder.sample_rate(args.smp)
-    if args.rmk:
-        builder.remarks(args.rmk)
-
-    return builder.build()
+    return QueryBuilder.from_mapping(query_tags_from_args(args))
+
+
+def build_queries_from_args(args) -> List[str]:
+    """
+    Build the query strings that together cover a command-line search.
+
+    Xeno-canto combines all tags of a query with AND, so a comma-separated
+    value for a tag in _MULTI_VALUE_TAGS (e.g. --cnt Spain,France) becomes
+    one query per value. With --parallel, an explicit --year range is also
+    split into sub-ranges. Every combination of values is one query.
+
+    Args:
+        args: Parsed command-line arguments
+
+    Returns:
+        Query strings suitable for the Xeno-canto API (one if nothing is split)
+    """
+    tags = query_tags_from_args(args)
+    choices = []
+    for tag, value in tags.items():
+        values = None
+        if tag in _MULTI_VALUE_TAGS:
+            values = list(dict.fromkeys(part.strip() for part in value.split(',') if part.strip()))
+        elif tag == 'year':
+            values = _split_year_range(value, args.parallel)
+        choices.append(values or [value])
+
+    return [
+        QueryBuilder.from_mapping(dict(zip(tags, combination)))
+        for combination in itertools.product(*choices)
+    ]
+
+
+def _split_year_range(year: Optional[str], parts: int) -> List[str]:
+    """
+    Split an explicit year range into contiguous, non-overlapping sub-ranges.
+
+    Args:
+        year: Value of --year (e.g. '2010-2020')
+        parts: Maximum number of sub-ranges
+
+    Returns:
+        Year tag values covering the whole range (e.g. ['2010-2015', '2016-2020']),
+        or an empty list if year is not a range that can be split
+    """
+    match = _YEAR_RANGE_RE.fullmatch(year.strip()) if year else None
+    if parts < 2 or match is None:
+        return []
+
+    first, last = int(match.group(1)), int(match.group(2))
+    if first >= last:
+        return []
+
+    parts = min(parts, last - first + 1)
+    size, extra = divmod(last - first + 1, parts)
+    ranges = []
+    start = first
+    for i in range(parts):
+        end = start + size - 1 + (i < extra)
+        ranges.append(str(start) if start == end else f"{start}-{end}")
+        start = end + 1
+    return ranges
+
+
+# Upper bound on searches run at once; each also prefetches pages ahead
+_MAX_PARALLEL_SEARCHES = 16
+
+
+def search_parallel(
+    client: XenoCantoClient,
+    queries: List[str],
+    per_page: int,
+    max_results: Optional[int] = None
+) -> List[Dict]:
+    """
+    Run several searches concurrently and merge their results.
+
+    The queries are expected to be disjoint parts of one search (e.g. split
+    by year), so overlapping network round trips shortens the total wait.
+    Recordings returned by more than one query are kept once.
+
+    Args:
+        client: Client used for all searches
+        queries: Query strings to search
+        per_page: Number of results per page
+        max_results: Maximum number of results to return (None for all)
+
+    Returns:
+        Recordings from all queries, in query order
+    """
+    def search(query: str) -> List[Dict]:
+        return client.search(query, per_page=per_page, max_results=max_results)
+
+    recordings = []
+    seen_ids = set()
+    with ThreadPoolExecutor(max_workers=min(len(queries), _MAX_PARALLEL_SEARCHES)) as executor:
+        for batch in executor.map(search, queries):
+            for recording in batch:
+                rec_id = recording.get('id')
+                if rec_id not in seen_ids:
+                    seen_ids.add(rec_id)
+                    recordings.append(recording)
+
+    if max_results:
+        del recordings[max_results:]
+    return recordings
 
 
 if __name__ == '__main__':
@@ -4,11 +4,58 @@ API client for the Xeno-canto API v3.
 Handles HTTP requests, pagination, error handling, and response parsing.
 """
 
+import itertools
+import math
 import os
+import threading
 import time
-from typing import Dict, List, Optional
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
+from xcapi.cache import DiskCache
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def create_session(pool_size: int = 32) -> requests.Session:
+    """
+    Create an HTTP session shared by all requests to xeno-canto.
+
+    The session keeps connections alive between requests and retries
+    transient failures (429 and 5xx responses) with exponential backoff,
+    honouring any Retry-After header sent by the server.
+
+    Args:
+        pool_size: Maximum number of pooled connections per host
+
+    Returns:
+        A configured requests.Session
+    """
+    retry = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 502, 503, 504]
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=retry
+    )
+
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({
+        'User-Agent': 'xcapi/0.1.0 (Python; requests)'
+    })
+    return session
 
 
 class XenoCantoClient:
@@ -25,13 +72,33 @@ class XenoCantoClient:
     
     API_ENDPOINT = "https://xeno-canto.org/api/3/recordings"
     
-    def __init__(self, api_key: Optional[str] = None):
+    # Minimum number of seconds between two requests to the API
+    REQUEST_INTERVAL = 0.1
+    
+    # Number of result pages fetched ahead in background threads
+    PREFETCH_PAGES = 4
+    
+    # Number of first-page responses kept in memory for reuse
+    FIRST_PAGE_CACHE_SIZE = 32
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        cache_ttl: float = 3600,
+        force_refresh: bool = False
+    ):
         """
         Initialize the Xeno-canto API client.
         
         Args:
             api_key: Your Xeno-canto API key. If not provided, will try to
                     read from XENO_CANTO_API_KEY environment variable.
+            cache_dir: Directory for cached API responses (default: ~/.cache/xcapi)
+            cache_ttl: Seconds a cached page stays fresh; 0 disables the cache
+                    (default: 3600)
+            force_refresh: If True, ignore cached pages and re-fetch them from
+                    the API (fresh responses are still written to the cache)
         
         Raises:
             ValueError: If no API key is provided or found in environment
@@ -44,10 +111,13 @@ class XenoCantoClient:
                 "XENO_CANTO_API_KEY in environment or .env file."
             )
         
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'xcapi/0.1.0 (Python; requests)'
-        })
+        self.session = create_session()
+        self.cache = DiskCache(cache_dir, ttl=cache_ttl) if cache_ttl > 0 else None
+        self.force_refresh = force_refresh
+        self._last_request = 0.0
+        self._throttle_lock = threading.Lock()
+        self._first_pages = OrderedDict()
+        self._first_pages_lock = threading.Lock()
     
     def search(
         self,
@@ -70,6 +140,35 @@ class XenoCantoClient:
         Returns:
             A list of recording dictionaries
         
+        Raises:
+            requests.exceptions.RequestException: If API request fails
+            ValueError: If query is empty or invalid parameters
+        """
+        return list(self.iter_search(query, per_page, max_results, verbose))
+    
+    def iter_search(
+        self,
+        query: str,
+        per_page: int = 100,
+        max_results: Optional[int] = None,
+        verbose: bool = False
+    ) -> Iterator[Dict]:
+        """
+        Search for recordings, yielding them one page at a time.
+        
+        Like search(), but only the pages currently being fetched or consumed
+        are held in memory, so results can be processed (e.g. passed straight
+        to Downloader.download_recordings) as they arrive.
+        
+        Args:
+            query: A search query string (use QueryBuilder to construct)
+            per_page: Number of results per page (50-500, default 100)
+            max_results: Maximum number of results to retrieve (None for all)
+            verbose: Whether to print progress information
+        
+        Returns:
+            An iterator over recording dictionaries
+        
         Raises:
             requests.exceptions.RequestException: If API request fails
             ValueError: If query is empty or invalid parameters
@@ -80,41 +179,94 @@ class XenoCantoClient:
         if not (50 <= per_page <= 500):
             raise ValueError("per_page must be between 50 and 500")
         
-        all_recordings = []
-        page = 1
+        recordings = itertools.chain.from_iterable(
+            response_data.get('recordings', [])
+            for response_data in self._iter_pages(query, per_page, max_results, verbose)
+        )
+        if max_results:
+            recordings = itertools.islice(recordings, max_results)
+        return recordings
+    
+    def _iter_pages(
+        self,
+        query: str,
+        per_page: int,
+        max_results: Optional[int],
+        verbose: bool
+    ) -> Iterator[Dict]:
+        """
+        Yield the result pages of a query in order.
         
-        while True:
-            if verbose:
-                print(f"Fetching page {page}...")
-            
-            response_data = self._fetch_page(query, page, per_page)
-            
-            recordings = response_data.get('recordings', [])
-            all_recordings.extend(recordings)
-            
+        Args:
+            query: Search query string
+            per_page: Results per page
+            max_results: Maximum number of results needed (None for all)
+            verbose: Whether to print progress information
+        
+        Yields:
+            JSON responses as dictionaries
+        """
+        if verbose:
+            print("Fetching page 1...")
+        
+        first_page = self._fetch_page(query, 1, per_page)
+        num_retrieved = len(first_page.get('recordings', []))
+        num_total = first_page.get('numRecordings', '?')
+        
+        if verbose:
+            print(f"  Retrieved {num_retrieved}/{num_total} recordings")
+        
+        yield first_page
+        
+        total_pages = first_page.get('numPages', 1)
+        if max_results:
+            total_pages = min(total_pages, math.ceil(max_results / per_page))
+        
+        # Remaining pages are fetched ahead while earlier ones are consumed
+        pages = self._prefetch_pages(query, range(2, total_pages + 1), per_page)
+        for page, response_data in enumerate(pages, 2):
+            num_retrieved += len(response_data.get('recordings', []))
             if verbose:
-                num_total = response_data.get('numRecordings', '?')
-                print(f"  Retrieved {len(all_recordings)}/{num_total} recordings")
-            
-            if max_results and len(all_recordings) >= max_results:
-                all_recordings = all_recordings[:max_results]
-                break
-            
-            current_page = response_data.get('page', page)
-            total_pages = response_data.get('numPages', 1)
-            
-            if current_page >= total_pages:
-                break
-            
-            page += 1
-            
-            time.sleep(0.1)
+                print(f"Fetched page {page}/{total_pages}")
+                print(f"  Retrieved {num_retrieved}/{num_total} recordings")
+            yield response_data
+    
+    def _prefetch_pages(
+        self,
+        query: str,
+        pages: Iterable[int],
+        per_page: int
+    ) -> Iterator[Dict]:
+        """
+        Yield result pages in order, fetching up to PREFETCH_PAGES ahead.
+        
+        Args:
+            query: Search query string
+            pages: Page numbers to fetch, in the order they should be yielded
+            per_page: Results per page
         
-        return all_recordings
+        Yields:
+            JSON responses as dictionaries
+        """
+        pages = iter(pages)
+        with ThreadPoolExecutor(max_workers=self.PREFETCH_PAGES) as executor:
+            pending = deque(
+                executor.submit(self._fetch_page, query, page, per_page)
+                for page in itertools.islice(pages, self.PREFETCH_PAGES)
+            )
+            while pending:
+                response_data = pending.popleft().result()
+                for page in itertools.islice(pages, 1):
+                    pending.append(executor.submit(self._fetch_page, query, page, per_page))
+                yield response_data
     
     def _fetch_page(self, query: str, page: int, per_page: int) -> Dict:
         """
-        Fetch a single page of results.
+        Fetch a single page of results, using the on-disk cache if enabled.
+        
+        First pages are also kept in a small in-memory LRU, so calling
+        get_metadata() and then search() with the same query and per_page
+        costs a single request.
         
         Args:
             query: Search query string
@@ -123,6 +275,77 @@ class XenoCantoClient:
         
         Returns:
             JSON response as a dictionary
+        """
+        if page != 1:
+            return self._fetch_page_cached(query, page, per_page)
+        
+        key = (query, per_page)
+        with self._first_pages_lock:
+            data = self._first_pages.get(key)
+            if data is not None:
+                self._first_pages.move_to_end(key)
+                return data
+        
+        data = self._fetch_page_cached(query, page, per_page)
+        
+        with self._first_pages_lock:
+            self._first_pages[key] = data
+            if len(self._first_pages) > self.FIRST_PAGE_CACHE_SIZE:
+                self._first_pages.popitem(last=False)
+        return data
+    
+    def _fetch_page_cached(self, query: str, page: int, per_page: int) -> Dict:
+        """
+        Fetch a single page of results through the on-disk cache, if enabled.
+        
+        Args:
+            query: Search query string
+            page: Page number (1-indexed)
+            per_page: Results per page
+        
+        Returns:
+            JSON response as a dictionary
+        """
+        if self.cache is None:
+            data, _ = self._request_page(query, page, per_page)
+            return data
+        
+        key = DiskCache.make_key(query, page, per_page)
+        entry = None if self.force_refresh else self.cache.get_entry(key)
+        if entry is not None and self.cache.is_fresh(entry):
+            return entry['body']
+        
+        # An expired entry with an ETag is revalidated instead of re-fetched
+        etag = entry.get('etag') if entry is not None else None
+        data, etag = self._request_page(query, page, per_page, etag=etag)
+        if data is None:
+            self.cache.revalidated(key, entry)
+            return entry['body']
+        
+        self.cache.set(key, data, etag=etag)
+        return data
+    
+    def _request_page(
+        self,
+        query: str,
+        page: int,
+        per_page: int,
+        etag: Optional[str] = None
+    ) -> Tuple[Optional[Dict], Optional[str]]:
+        """
+        Request a single page of results from the API.
+        
+        Consecutive requests are spaced at least REQUEST_INTERVAL seconds apart.
+        
+        Args:
+            query: Search query string
+            page: Page number (1-indexed)
+            per_page: Results per page
+            etag: ETag of a cached copy; makes the request conditional
+        
+        Returns:
+            The JSON response as a dictionary (None if the server confirmed
+            the cached copy with 304 Not Modified) and the response's ETag
         
         Raises:
             requests.exceptions.RequestException: If request fails
@@ -135,11 +358,24 @@ class XenoCantoClient:
             'per_page': per_page
         }
         
+        with self._throttle_lock:
+            wait = self._last_request + self.REQUEST_INTERVAL - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            self._last_request = time.monotonic()
+        
+        headers = {'If-None-Match': etag} if etag else {}
+        
         try:
-            response = self.session.get(self.API_ENDPOINT, params=params, timeout=30)
+            response = self.session.get(
+                self.API_ENDPOINT, params=params, headers=headers, timeout=30
+            )
+            if response.status_code == 304:
+                return None, etag
             response.raise_for_status()
             
-            data = response.json()
+            # orjson (optional) parses large result pages several times faster
+            data = orjson.loads(response.content) if orjson else response.json()
             
             if 'error' in data:
                 error_info = data['error']
@@ -148,25 +384,31 @@ class XenoCantoClient:
                     f"{error_info.get('message', 'Unknown error')}"
                 )
             
-            return data
+            return data, response.headers.get('ETag')
             
         except requests.exceptions.Timeout:
             raise RuntimeError("Request timed out. Please try again.")
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             raise RuntimeError(f"Request failed: {str(e)}")
     
-    def get_metadata(self, query: str, verbose: bool = False) -> Dict:
+    def get_metadata(self, query: str, verbose: bool = False, per_page: int = 1) -> Dict:
         """
         Get metadata about search results without fetching all recordings.
         
+        By default only a single recording is requested. Pass the per_page
+        you are going to search() with instead to have that search reuse
+        this response as its first page.
+        
         Args:
             query: Search query string
             verbose: Whether to print information
+            per_page: Results per page for the request (default 1)
         
         Returns:
             Dictionary with numRecordings, numSpecies, and numPages
+            (numPages is relative to per_page)
         """
-        response_data = self._fetch_page(query, page=1, per_page=1)
+        response_data = self._fetch_page(query, page=1, per_page=per_page)
         
         metadata = {
             'numRecordings': response_data.get('numRecordings', 0),
@@ -5,12 +5,32 @@ Handles downloading audio files, organizing them into folders, and saving metada
 """
 
 import csv
+import hashlib
+import importlib.util
+import itertools
 import json
+import operator
 import os
+import shutil
+import sys
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from datetime import datetime
+from email.utils import formatdate, parsedate_to_datetime
 from pathlib import Path
-from typing import Dict, List, Optional
-import requests
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional, TextIO, Tuple
+from xcapi.client import create_session
+
+# pyarrow is optional and takes tens of milliseconds to import, so here we
+# only check that it is installed; _write_parquet() imports it when needed
+HAVE_PYARROW = importlib.util.find_spec('pyarrow') is not None
+
+
+# Characters that are invalid in file/folder names, mapped to '_'
+_SANITIZE_TABLE = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
+
+# Buffer size used when streaming audio to disk (256 KiB)
+COPY_BUFFER_SIZE = 1 << 18
 
 
 class Downloader:
@@ -25,15 +45,29 @@ class Downloader:
         >>> downloader.download_recordings(recordings, verbose=True)
     """
 
-    def __init__(self, output_dir: str = "./xc_downloads"):
+    def __init__(
+        self,
+        output_dir: str = "./xc_downloads",
+        max_workers: int = 8,
+        dedupe: bool = False
+    ):
         """
         Initialize the downloader.
 
         Args:
             output_dir: Base directory for downloads (default: ./xc_downloads)
+            max_workers: Number of recordings downloaded concurrently (default: 8)
+            dedupe: If True, hash every downloaded file and replace files whose
+                    content was already downloaded with hard links (default: False)
         """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.max_workers = max_workers
+        self.dedupe = dedupe
+        self.session = create_session(pool_size=max_workers)
 
     # ------------------------------------------------------------------
     # Public methods
@@ -41,81 +75,170 @@ class Downloader:
 
     def download_recordings(
         self,
-        recordings: List[Dict],
+        recordings: Iterable[Dict],
         verbose: bool = False,
-        redownload: bool = False
+        redownload: bool = False,
+        total: Optional[int] = None
     ) -> Dict[str, int]:
         """
-        Download a list of recordings.
+        Download a list or stream of recordings.
 
         By default, skips recordings already present in xcapi_runs.json or,
         if that does not exist, bootstrapped from metadata.csv. Use
         redownload=True to ignore existing records and start completely fresh.
 
+        Recordings are consumed lazily, so a generator such as
+        XenoCantoClient.iter_search() can be passed directly. Each recording
+        is written to metadata.csv as soon as its download finishes, keeping
+        only a bounded number of recordings in memory at a time.
+
+        With dedupe enabled, files whose content matches an earlier download
+        (tracked by SHA-256 in .xcapi_index) are replaced by hard links to it.
+
         Args:
-            recordings: List of recording dictionaries from XenoCantoClient
+            recordings: Recording dictionaries from XenoCantoClient
             verbose: Whether to print progress information
             redownload: If True, re-download everything and overwrite existing records
+            total: Number of recordings shown in progress messages when
+                   recordings is a stream (default: its len(), if it has one)
 
         Returns:
-            Dictionary with download statistics (downloaded, skipped, failed)
+            Dictionary with download statistics (downloaded, skipped, failed,
+            and linked: downloads replaced by a hard link to identical content)
         """
-        stats = {'downloaded': 0, 'skipped': 0, 'failed': 0}
+        stats = {'downloaded': 0, 'skipped': 0, 'failed': 0, 'linked': 0}
+        if total is None:
+            total = len(recordings) if hasattr(recordings, '__len__') else '?'
 
-        if not recordings:
+        recordings = iter(recordings)
+        first = next(recordings, None)
+        if first is None:
             if verbose:
                 print("No recordings to download.")
             return stats
+        recordings = itertools.chain([first], recordings)
 
         # Determine which IDs to skip
         existing_ids = set()
         if not redownload:
             existing_ids = self._load_existing_ids(verbose=verbose, allow_bootstrap=True)
 
-        new_recordings = []
-
-        for i, recording in enumerate(recordings, 1):
-            rec_id = str(recording.get('id', ''))
-            species_name = f"{recording.get('gen', 'Unknown')} {recording.get('sp', 'unknown')}"
-
-            if rec_id in existing_ids:
-                stats['skipped'] += 1
-                if verbose:
-                    print(f"[{i}/{len(recordings)}] Skipping {species_name} (ID: {rec_id}) — already downloaded")
-                continue
-
-            if verbose:
-                print(f"[{i}/{len(recordings)}] Downloading {species_name} (ID: {rec_id})")
+        metadata_file = self.output_dir / 'metadata.csv'
+        content_index = _ContentIndex(self.output_dir) if self.dedupe else None
+        new_ids = []
+        species_folders = {}
+        futures = {}
 
+        def collect(future):
+            recording = futures.pop(future)
             try:
-                self._download_recording(recording, verbose)
-                stats['downloaded'] += 1
-                new_recordings.append(recording)
+                output_path, modified, digest = future.result()
             except Exception as e:
                 stats['failed'] += 1
                 if verbose:
-                    print(f"  ERROR: {str(e)}")
-
-        # Persist results
-        if new_recordings:
-            self._append_metadata(new_recordings, redownload=redownload)
-            self._update_runs(new_recordings, redownload=redownload)
-        elif redownload and not new_recordings:
-            # redownload requested but nothing came back — still reset files
-            self._append_metadata([], redownload=True)
-            self._update_runs([], redownload=True)
+                    print(f"  ERROR (ID: {recording.get('id', '')}): {str(e)}")
+                return
+            if modified:
+                stats['downloaded'] += 1
+                # The index is only touched here, in the submitting thread
+                linked = digest is not None and self._link_duplicate(output_path, digest, content_index)
+                if linked:
+                    stats['linked'] += 1
+                if verbose:
+                    size_mb = output_path.stat().st_size / (1024 * 1024)
+                    note = ", linked to identical file" if linked else ""
+                    print(f"  ✓ {output_path.name} ({size_mb:.2f} MB{note})")
+            else:
+                # The file on disk is current; record it without re-downloading
+                stats['skipped'] += 1
+                if verbose:
+                    print(f"  = {output_path.name} (not modified)")
+            writer.writerow(self._csv_row(recording))
+            new_ids.append(str(recording['id']))
+
+        f, writer = self._open_csv(metadata_file, mode='w' if redownload else 'a')
+        try:
+            with f, ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                try:
+                    for i, recording in enumerate(recordings, 1):
+                        rec_id = str(recording.get('id', ''))
+                        species_key = (recording.get('gen', 'Unknown'), recording.get('sp', 'unknown'))
+
+                        if rec_id in existing_ids:
+                            stats['skipped'] += 1
+                            if verbose:
+                                species_name = f"{species_key[0]} {species_key[1]}"
+                                print(f"[{i}/{total}] Skipping {species_name} (ID: {rec_id}) — already downloaded")
+                            continue
+
+                        # Folders are created here, before submission, so worker
+                        # threads never race on mkdir. The folder name is built and
+                        # sanitized once per species; later recordings only pay
+                        # for the dictionary lookup.
+                        species_folder = species_folders.get(species_key)
+                        if species_folder is None:
+                            species_folder = self._get_species_folder(recording)
+                            species_folder.mkdir(parents=True, exist_ok=True)
+                            species_folders[species_key] = species_folder
+
+                        if verbose:
+                            species_name = f"{species_key[0]} {species_key[1]}"
+                            print(f"[{i}/{total}] Downloading {species_name} (ID: {rec_id})")
+
+                        future = executor.submit(
+                            self._download_recording, recording, species_folder, not redownload
+                        )
+                        futures[future] = recording
+
+                        # Bound the number of queued downloads held in memory
+                        if len(futures) >= 2 * self.max_workers:
+                            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                            for future in done:
+                                collect(future)
+
+                    for future in as_completed(list(futures)):
+                        collect(future)
+                except BaseException:
+                    # Interrupted: drop queued downloads so shutdown does not
+                    # run them, let the ones in progress finish, and record
+                    # every file that reached the disk before re-raising
+                    for future in futures:
+                        future.cancel()
+                    wait(futures)
+                    for future in list(futures):
+                        if future.cancelled():
+                            del futures[future]
+                        else:
+                            collect(future)
+                    raise
+        finally:
+            # Record whatever completed, even if the run was interrupted
+            if new_ids or redownload:
+                self._update_runs(new_ids, redownload=redownload)
+            if new_ids:
+                print(f"Metadata saved to {metadata_file}")
+
+        # Only reached when the run completed. A failed export must not turn a
+        # successful download into an error, so it is reported and skipped.
+        if (new_ids or redownload) and HAVE_PYARROW:
+            try:
+                self._write_parquet(metadata_file)
+            except Exception as e:
+                print(f"Warning: could not write {metadata_file.with_suffix('.parquet').name}: {e}", file=sys.stderr)
 
         if verbose:
             print(f"\nDownload complete:")
             print(f"  Downloaded: {stats['downloaded']}")
             print(f"  Skipped:    {stats['skipped']}")
             print(f"  Failed:     {stats['failed']}")
+            if self.dedupe:
+                print(f"  Linked:     {stats['linked']}")
 
         return stats
 
     def save_metadata_only(
         self,
-        recordings: List[Dict],
+        recordings: Iterable[Dict],
         verbose: bool = False
     ) -> str:
         """
@@ -128,16 +251,20 @@ class Downloader:
         Does NOT modify metadata.csv or xcapi_runs.json.
 
         Args:
-            recordings: List of recording dictionaries from XenoCantoClient
+            recordings: Recording dictionaries from XenoCantoClient (a list
+                        or a stream such as XenoCantoClient.iter_search())
             verbose: Whether to print progress information
 
         Returns:
             Path to the saved metadata_only.csv file
         """
-        if not recordings:
+        recordings = iter(recordings)
+        first = next(recordings, None)
+        if first is None:
             if verbose:
                 print("No recordings returned by query.")
             return ""
+        recordings = itertools.chain([first], recordings)
 
         # Load existing downloaded IDs (json first, then bootstrap from csv)
         existing_ids = self._load_existing_ids(
@@ -146,14 +273,21 @@ class Downloader:
             write_bootstrap=False
         )
 
-        # Compute delta — only recordings not yet downloaded
-        new_recordings = [
-            r for r in recordings
-            if str(r.get('id', '')) not in existing_ids
-        ]
+        n_total = 0
+        n_new = 0
 
-        n_total = len(recordings)
-        n_new = len(new_recordings)
+        def new_recordings():
+            # Compute delta — only recordings not yet downloaded
+            nonlocal n_total, n_new
+            for r in recordings:
+                n_total += 1
+                if str(r.get('id', '')) not in existing_ids:
+                    n_new += 1
+                    yield r
+
+        # An empty delta still leaves a header-only file so the user knows it ran
+        metadata_only_file = self.output_dir / 'metadata_only.csv'
+        self._write_csv(metadata_only_file, new_recordings(), mode='w')
         n_skip = n_total - n_new
 
         if verbose:
@@ -161,16 +295,9 @@ class Downloader:
             print(f"  Already downloaded: {n_skip}")
             print(f"  New (not yet downloaded): {n_new}")
 
-        metadata_only_file = self.output_dir / 'metadata_only.csv'
-
-        if n_new == 0:
-            # Write an empty file with just the header so the user knows it ran
-            self._write_csv(metadata_only_file, [], mode='w')
-            if verbose:
+            if n_new == 0:
                 print("No new recordings to report. metadata_only.csv cleared.")
-        else:
-            self._write_csv(metadata_only_file, new_recordings, mode='w')
-            if verbose:
+            else:
                 print(f"✓ metadata_only.csv written with {n_new} new recording(s) → {metadata_only_file}")
 
         return str(metadata_only_file)
@@ -194,13 +321,18 @@ class Downloader:
                 'species_folders': []
             }
 
-        for item in self.output_dir.iterdir():
-            if item.is_dir():
-                species_folders.append(item.name)
-                for file in item.iterdir():
-                    if file.is_file():
-                        total_files += 1
-                        total_size += file.stat().st_size
+        # os.scandir reuses the file type from the directory listing, so only
+        # regular files need an extra stat() for their size
+        with os.scandir(self.output_dir) as entries:
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                species_folders.append(entry.name)
+                with os.scandir(entry.path) as files:
+                    for file in files:
+                        if file.is_file(follow_symlinks=False):
+                            total_files += 1
+                            total_size += file.stat(follow_symlinks=False).st_size
 
         return {
             'total_files': total_files,
@@ -209,6 +341,18 @@ class Downloader:
             'species_folders': sorted(species_folders)
         }
 
+    def close(self):
+        """Close the HTTP session."""
+        self.session.close()
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
     # ------------------------------------------------------------------
     # ID tracking
     # ------------------------------------------------------------------
@@ -273,17 +417,16 @@ class Downloader:
             print("No previous download records found — downloading everything")
         return set()
 
-    def _update_runs(self, recordings: List[Dict], redownload: bool = False):
+    def _update_runs(self, new_ids: List[str], redownload: bool = False):
         """
         Update xcapi_runs.json with newly downloaded recording IDs.
 
         Args:
-            recordings: Newly downloaded recordings
+            new_ids: IDs of the newly downloaded recordings
             redownload: If True, overwrite runs file with just this run
         """
         runs_path = self.output_dir / 'xcapi_runs.json'
         timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M")
-        new_ids = [str(r['id']) for r in recordings]
 
         if redownload:
             runs = {timestamp: new_ids}
@@ -292,10 +435,44 @@ class Downloader:
                 runs = json.loads(runs_path.read_text(encoding='utf-8'))
             else:
                 runs = {}
-            runs[timestamp] = new_ids
+            # Runs started within the same minute share one entry
+            runs.setdefault(timestamp, []).extend(new_ids)
 
         runs_path.write_text(json.dumps(runs, indent=2), encoding='utf-8')
 
+    # ------------------------------------------------------------------
+    # Content deduplication
+    # ------------------------------------------------------------------
+
+    def _link_duplicate(self, path: Path, digest: str, index: '_ContentIndex') -> bool:
+        """
+        Replace a new download with a hard link to an identical earlier file.
+
+        If no other unchanged file with the same content is indexed, the new
+        file is added to the index instead. When the filesystem cannot
+        hard-link, the downloaded copy is kept and indexed.
+
+        Args:
+            path: Freshly downloaded file
+            digest: SHA-256 hex digest of its content
+            index: Content index of output_dir, updated in place
+
+        Returns:
+            True if the file was replaced by a hard link
+        """
+        original = index.find(digest, path)
+        if original is not None:
+            link_path = path.with_name(path.name + '.link')
+            try:
+                os.link(original, link_path)
+                os.replace(link_path, path)
+                return True
+            except OSError:
+                link_path.unlink(missing_ok=True)
+
+        index.add(digest, path)
+        return False
+
     # ------------------------------------------------------------------
     # CSV helpers
     # ------------------------------------------------------------------
@@ -308,58 +485,128 @@ class Downloader:
         'temp', 'regnr', 'auto', 'dvc', 'mic', 'smp'
     ]
 
-    def _write_csv(self, path: Path, recordings: List[Dict], mode: str = 'a'):
+    # Builds a CSV row tuple from a recording in a single C-level call
+    _ROW_GETTER = operator.itemgetter(*FIELDNAMES)
+
+    def _csv_row(self, recording: Dict) -> Tuple:
         """
-        Write recordings to a CSV file.
+        Return the CSV row for a recording, in FIELDNAMES order.
+
+        Missing fields are written as empty strings.
+
+        Args:
+            recording: Recording dictionary
+
+        Returns:
+            Tuple of field values
+        """
+        try:
+            # API v3 recordings carry every field, so no copy is needed
+            return self._ROW_GETTER(recording)
+        except KeyError:
+            return self._ROW_GETTER(defaultdict(str, recording))
+
+    def _open_csv(self, path: Path, mode: str = 'a') -> Tuple[TextIO, Any]:
+        """
+        Open a CSV file for writing recordings.
+
+        The header row is written unless an existing file is being appended to.
 
         Args:
             path: Destination file path
-            recordings: List of recording dictionaries
             mode: 'w' to overwrite, 'a' to append
+
+        Returns:
+            The open file and a csv.writer for rows from _csv_row()
         """
         file_exists = path.exists() and mode == 'a'
 
-        with open(path, mode, newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(
-                f, fieldnames=self.FIELDNAMES, extrasaction='ignore'
-            )
-            if not file_exists:
-                writer.writeheader()
-            for recording in recordings:
-                row = {k: recording.get(k, '') for k in self.FIELDNAMES}
-                if 'also' in recording and isinstance(recording['also'], list):
-                    row['also'] = '; '.join(recording['also'])
-                writer.writerow(row)
+        f = open(path, mode, newline='', encoding='utf-8')
+        writer = csv.writer(f)
+        if not file_exists:
+            writer.writerow(self.FIELDNAMES)
+        return f, writer
 
-    def _append_metadata(self, recordings: List[Dict], redownload: bool = False):
+    def _write_csv(self, path: Path, recordings: Iterable[Dict], mode: str = 'a'):
         """
-        Append new recording metadata to metadata.csv, or overwrite if redownload.
+        Write recordings to a CSV file.
 
         Args:
-            recordings: List of recording dictionaries
-            redownload: If True, overwrite the file
+            path: Destination file path
+            recordings: Recording dictionaries
+            mode: 'w' to overwrite, 'a' to append
         """
-        metadata_file = self.output_dir / 'metadata.csv'
-        mode = 'w' if redownload else 'a'
-        self._write_csv(metadata_file, recordings, mode=mode)
-        if recordings:
-            print(f"Metadata saved to {metadata_file}")
+        f, writer = self._open_csv(path, mode=mode)
+        with f:
+            writer.writerows(map(self._csv_row, recordings))
+
+    def _write_parquet(self, csv_path: Path) -> Path:
+        """
+        Write a zstd-compressed Parquet copy of a metadata CSV file.
+
+        Requires the optional pyarrow dependency. All columns are stored as
+        strings, exactly as they appear in the CSV. The CSV is converted one
+        block at a time, so memory use does not grow with the file, and the
+        Parquet file is replaced only once it has been written completely.
+
+        Args:
+            csv_path: Metadata CSV file to convert
+
+        Returns:
+            Path to the Parquet file (same name, .parquet suffix)
+        """
+        import pyarrow
+        import pyarrow.csv
+        import pyarrow.parquet
+
+        parquet_path = csv_path.with_suffix('.parquet')
+        tmp_path = parquet_path.with_name(parquet_path.name + '.part')
+        reader = pyarrow.csv.open_csv(
+            csv_path,
+            parse_options=pyarrow.csv.ParseOptions(newlines_in_values=True),
+            convert_options=pyarrow.csv.ConvertOptions(
+                column_types={name: pyarrow.string() for name in self.FIELDNAMES},
+                strings_can_be_null=False
+            )
+        )
+        try:
+            with reader, pyarrow.parquet.ParquetWriter(tmp_path, reader.schema, compression='zstd') as writer:
+                for batch in reader:
+                    writer.write_batch(batch)
+            os.replace(tmp_path, parquet_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        return parquet_path
 
     # ------------------------------------------------------------------
     # Download helpers
     # ------------------------------------------------------------------
 
-    def _download_recording(self, recording: Dict, verbose: bool) -> None:
+    def _download_recording(
+        self,
+        recording: Dict,
+        species_folder: Path,
+        conditional: bool = True
+    ) -> Tuple[Path, bool, Optional[str]]:
         """
         Download a single recording to its species folder.
 
+        If conditional is True and the audio file already exists (e.g. the
+        run log no longer lists it), the request is made conditional on the
+        file's modification time and the transfer is skipped when the server
+        answers 304 Not Modified.
+
         Args:
             recording: Recording dictionary
-            verbose: Print progress
-        """
-        species_folder = self._get_species_folder(recording)
-        species_folder.mkdir(parents=True, exist_ok=True)
+            species_folder: Existing folder to save the audio file in
+            conditional: Whether an existing file may be kept if unchanged on
+                         the server (False always transfers, as on a redownload)
 
+        Returns:
+            Path to the audio file, whether it was (re-)downloaded, and the
+            SHA-256 hex digest of the new file if dedupe is enabled
+        """
         file_url = recording.get('file', '')
         if not file_url:
             raise ValueError("No file URL found in recording")
@@ -373,19 +620,102 @@ class Downloader:
         file_name = self._sanitize_filename(file_name)
         output_path = species_folder / file_name
 
-        response = requests.get(file_url, stream=True, timeout=60)
-        response.raise_for_status()
+        headers = {}
+        if conditional and output_path.exists():
+            headers['If-Modified-Since'] = formatdate(
+                output_path.stat().st_mtime, usegmt=True
+            )
+
+        # Write to a temporary file and move it into place once complete, so
+        # an interrupted download never leaves a truncated audio file behind
+        part_path = output_path.with_name(output_path.name + '.part')
 
-        with open(output_path, 'wb') as f:
-            downloaded = 0
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
-                    downloaded += len(chunk)
+        with self.session.get(file_url, headers=headers, stream=True, timeout=60) as response:
+            if response.status_code == 304:
+                return output_path, False, None
 
-        if verbose:
-            size_mb = downloaded / (1024 * 1024)
-            print(f"  ✓ {file_name} ({size_mb:.2f} MB)")
+            response.raise_for_status()
+            response.raw.decode_content = True
+            digest = hashlib.sha256() if self.dedupe else None
+
+            try:
+                with open(part_path, 'wb') as f:
+                    self._preallocate(f, response)
+                    if digest is None:
+                        shutil.copyfileobj(response.raw, f, length=COPY_BUFFER_SIZE)
+                    else:
+                        self._copy_hashing(response.raw, f, digest)
+                    f.truncate()
+                self._set_mtime(part_path, response.headers.get('Last-Modified'))
+                os.replace(part_path, output_path)
+            except BaseException:
+                part_path.unlink(missing_ok=True)
+                raise
+
+        return output_path, True, digest.hexdigest() if digest is not None else None
+
+    def _copy_hashing(self, src: BinaryIO, dst: BinaryIO, digest):
+        """
+        Copy a stream like shutil.copyfileobj, feeding every block to a hash.
+
+        Args:
+            src: Stream to read from
+            dst: File to write to
+            digest: hashlib object updated with the copied data
+        """
+        read, write, update = src.read, dst.write, digest.update
+        while True:
+            block = read(COPY_BUFFER_SIZE)
+            if not block:
+                break
+            update(block)
+            write(block)
+
+    def _preallocate(self, f: BinaryIO, response):
+        """
+        Reserve disk space for a download whose size is known up front.
+
+        Allocating the whole file before writing lets the filesystem lay it
+        out contiguously. Only done where os.posix_fallocate is available
+        and the body is not content-encoded (so Content-Length is the size
+        on disk). The caller truncates the file after writing in case the
+        body turns out shorter.
+
+        Args:
+            f: File opened for writing
+            response: Streaming response for the audio file
+        """
+        if not hasattr(os, 'posix_fallocate') or 'Content-Encoding' in response.headers:
+            return
+        try:
+            size = int(response.headers.get('Content-Length', 0))
+        except ValueError:
+            return
+        if size > 0:
+            try:
+                os.posix_fallocate(f.fileno(), 0, size)
+            except OSError:
+                # Not supported by every filesystem; writing still works
+                pass
+
+    def _set_mtime(self, path: Path, last_modified: Optional[str]):
+        """
+        Set a file's modification time from a Last-Modified header.
+
+        Keeping the server's timestamp makes later If-Modified-Since
+        requests compare against the version that was actually downloaded.
+
+        Args:
+            path: File to update
+            last_modified: Value of the Last-Modified header, if any
+        """
+        if not last_modified:
+            return
+        try:
+            timestamp = parsedate_to_datetime(last_modified).timestamp()
+        except (TypeError, ValueError):
+            return
+        os.utime(path, (timestamp, timestamp))
 
     def _get_species_folder(self, recording: Dict) -> Path:
         """
@@ -412,6 +742,92 @@ class Downloader:
         Returns:
             Sanitized filename
         """
-        for char in '<>:"/\\|?*':
-            filename = filename.replace(char, '_')
-        return filename.strip('. ')
\ No newline at end of file
+        return filename.translate(_SANITIZE_TABLE).strip('. ')
+
+
+class _ContentIndex:
+    """
+    SHA-256 index of downloaded audio files, kept in <output_dir>/.xcapi_index.
+
+    Each line is "<sha256> <size> <mtime_ns> <path relative to output_dir>".
+    The file is only appended to: a later line for a path replaces that
+    path's earlier entry, so a file re-downloaded with different content
+    stops answering for its old digest. Size and mtime are checked before
+    an indexed file is used, so files changed outside a dedupe run are
+    never linked to.
+    """
+
+    def __init__(self, output_dir: Path):
+        """
+        Load the index of output_dir, if it has one.
+
+        Args:
+            output_dir: Download directory the index belongs to
+        """
+        self.output_dir = output_dir
+        self.path = output_dir / '.xcapi_index'
+        self._by_digest: Dict[str, Tuple[str, int, int]] = {}
+        self._by_path: Dict[str, str] = {}
+
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                for line in f:
+                    parts = line.rstrip('\n').split(' ', 3)
+                    # Skips malformed lines and the older "<sha256> <path>" format
+                    if len(parts) == 4 and parts[1].isdigit() and parts[2].isdigit():
+                        digest, size, mtime_ns, rel_path = parts
+                        self._put(digest, rel_path, int(size), int(mtime_ns))
+        except FileNotFoundError:
+            pass
+
+    def find(self, digest: str, path: Path) -> Optional[Path]:
+        """
+        Return an indexed file with the given content, other than path.
+
+        Args:
+            digest: SHA-256 hex digest to look up
+            path: File the content belongs to, which is never returned
+
+        Returns:
+            Path of a file that still has the size and mtime it was indexed
+            with, or None
+        """
+        entry = self._by_digest.get(digest)
+        if entry is None:
+            return None
+        rel_path, size, mtime_ns = entry
+        original = self.output_dir / rel_path
+        if original == path:
+            return None
+        try:
+            stat = original.stat()
+        except OSError:
+            return None
+        if (stat.st_size, stat.st_mtime_ns) != (size, mtime_ns):
+            return None
+        return original
+
+    def add(self, digest: str, path: Path):
+        """
+        Record the content of a file, replacing any earlier entry for it.
+
+        Args:
+            digest: SHA-256 hex digest of the file
+            path: File inside output_dir
+        """
+        rel_path = path.relative_to(self.output_dir).as_posix()
+        stat = path.stat()
+        self._put(digest, rel_path, stat.st_size, stat.st_mtime_ns)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(f"{digest} {stat.st_size} {stat.st_mtime_ns} {rel_path}\n")
+
+    def _put(self, digest: str, rel_path: str, size: int, mtime_ns: int):
+        """Update the in-memory maps with one entry."""
+        old_digest = self._by_path.get(rel_path)
+        if old_digest is not None and old_digest != digest:
+            # The file's content changed; it no longer answers for old_digest
+            old_entry = self._by_digest.get(old_digest)
+            if old_entry is not None and old_entry[0] == rel_path:
+                del self._by_digest[old_digest]
+        self._by_path[rel_path] = digest
+        self._by_digest[digest] = (rel_path, size, mtime_ns)
@@ -5,10 +5,83 @@ This module provides a fluent interface for constructing search queries
 using all supported Xeno-canto API search tags.
 """
 
-from typing import List, Optional
+from typing import Any, Callable, Iterable, List, Mapping, Optional
+import functools
+import inspect
 import re
 
 
+# Tags whose values are quoted (unless they are plain numbers or numeric ranges)
+QUOTED_TAGS = frozenset({
+    'sp', 'ssp', 'en', 'rec', 'cnt', 'loc', 'area', 'type', 'method', 'len',
+    'also', 'time', 'alt', 'lat', 'lon', 'regnr', 'dvc', 'mic', 'rmk'
+})
+
+# Placeholder for a filter value that was not passed positionally
+_MISSING = object()
+
+# Range pattern like 10-15 or 2020-2024 (numbers with dash)
+_RANGE_RE = re.compile(r'^\d+(\-\d+)?$')
+
+
+def _format_tag(tag: str, value: str, quote: bool) -> str:
+    """
+    Format a single tag:value pair for a query string.
+    
+    Args:
+        tag: The search tag name (e.g., 'gen', 'sp', 'cnt')
+        value: The value for the tag
+        quote: Whether to quote the value (for multi-word values)
+    
+    Returns:
+        The formatted tag, e.g. 'gen:Larus' or 'cnt:"Costa Rica"'
+    """
+    # Cheap checks first: most values are single words for unquoted tags
+    # and never need the range match below.
+    if quote or ' ' in value or value.startswith(('>', '<', '=')):
+        # Ranges (e.g. 10-15) and already quoted values are left as they are
+        if not (_RANGE_RE.match(value) or (value.startswith('"') and value.endswith('"'))):
+            return f'{tag}:"{value}"'
+
+    return f"{tag}:{value}"
+
+
+def _tag(name: str, quote: bool = False) -> Callable:
+    """
+    Turn a documented stub into a QueryBuilder filter method for one tag.
+    
+    The tag name and quoting are fixed when the class is defined, so the
+    generated method only has to format the value and append it. The
+    stub's name, signature and docstring are kept for help() and IDEs, and
+    the value can be passed positionally or by the stub's parameter name
+    (e.g. genus(genus='Larus')).
+    
+    Args:
+        name: The search tag name (e.g., 'gen', 'sp', 'cnt')
+        quote: Whether to quote the value (for multi-word values)
+    
+    Returns:
+        A decorator for a method stub taking a single value
+    """
+    def decorator(stub: Callable) -> Callable:
+        signature = inspect.signature(stub)
+        param = list(signature.parameters)[1]
+
+        @functools.wraps(stub)
+        def method(self: 'QueryBuilder', value: Any = _MISSING, /, **kwargs) -> 'QueryBuilder':
+            if kwargs or value is _MISSING:
+                # Keyword or incomplete call: bind like the stub would, so
+                # errors read the same as for a hand-written method
+                args = () if value is _MISSING else (value,)
+                value = signature.bind(self, *args, **kwargs).arguments[param]
+            if value:
+                self._tags.append(_format_tag(name, value, quote))
+                self._built = None
+            return self
+        return method
+    return decorator
+
+
 class QueryBuilder:
     """
     Builder class for constructing Xeno-canto API search queries.
@@ -22,9 +95,13 @@ class QueryBuilder:
         gen:Larus sp:fuscus q:A
     """
     
+    # Builders are often created one per query in loops; slots keep them small
+    __slots__ = ('_tags', '_built')
+    
     def __init__(self):
         """Initialize an empty query builder."""
         self._tags = []
+        self._built: Optional[str] = None
     
     def _add_tag(self, tag: str, value: str, quote: bool = False) -> 'QueryBuilder':
         """
@@ -40,36 +117,55 @@ class QueryBuilder:
         """
         if not value:
             return self
-        # Detect range pattern like 10-15 or 2020-2024 (numbers with dash)
-        is_range = bool(re.match(r'^\d+(\-\d+)?$', value))
-
-        # Should we quote it?
-        if (
-            not is_range and
-            (quote or ' ' in value or value.startswith(('>', '<', '=')))
-        ):
-            if not (value.startswith('"') and value.endswith('"')):
-                value = f'"{value}"'
-
-        self._tags.append(f"{tag}:{value}")
+        self._tags.append(_format_tag(tag, value, quote))
+        self._built = None
         return self
     
+    @classmethod
+    def from_mapping(
+        cls,
+        tags: Mapping[str, str],
+        quote_tags: Iterable[str] = QUOTED_TAGS
+    ) -> str:
+        """
+        Build a query string directly from a tag -> value mapping.
+        
+        Equivalent to adding each tag in order on a new builder and calling
+        build(), without creating the builder. Empty values are skipped.
+        
+        Args:
+            tags: Search tags and their values, in query order
+            quote_tags: Tags whose values should be quoted (default: QUOTED_TAGS)
+        
+        Returns:
+            A query string suitable for the Xeno-canto API
+        
+        Example:
+            >>> QueryBuilder.from_mapping({'gen': 'Larus', 'cnt': 'Costa Rica'})
+            'gen:Larus cnt:"Costa Rica"'
+        """
+        return ' '.join(
+            _format_tag(tag, value, tag in quote_tags)
+            for tag, value in tags.items() if value
+        )
+    
+    @_tag('gen')
     def genus(self, genus: str) -> 'QueryBuilder':
         """Filter by genus name."""
-        return self._add_tag('gen', genus)
     
+    @_tag('sp', quote=True)
     def species(self, species: str) -> 'QueryBuilder':
         """Filter by species name (specific epithet or full species name)."""
-        return self._add_tag('sp', species, quote=True)
     
+    @_tag('ssp', quote=True)
     def subspecies(self, subspecies: str) -> 'QueryBuilder':
         """Filter by subspecies name."""
-        return self._add_tag('ssp', subspecies, quote=True)
     
+    @_tag('fam')
     def family(self, family: str) -> 'QueryBuilder':
         """Filter by family name."""
-        return self._add_tag('fam', family)
     
+    @_tag('grp')
     def group(self, group: str) -> 'QueryBuilder':
         """
         Filter by taxonomic group.
@@ -77,24 +173,24 @@ class QueryBuilder:
         Args:
             group: One of 'birds', 'grasshoppers', 'bats', 'land mammals', 'frogs', 'soundscape'
         """
-        return self._add_tag('grp', group)
     
+    @_tag('en', quote=True)
     def english_name(self, name: str) -> 'QueryBuilder':
         """Filter by English common name."""
-        return self._add_tag('en', name, quote=True)
     
+    @_tag('rec', quote=True)
     def recordist(self, name: str) -> 'QueryBuilder':
         """Filter by recordist name."""
-        return self._add_tag('rec', name, quote=True)
     
+    @_tag('cnt', quote=True)
     def country(self, country: str) -> 'QueryBuilder':
         """Filter by country name."""
-        return self._add_tag('cnt', country, quote=True)
     
+    @_tag('loc', quote=True)
     def location(self, location: str) -> 'QueryBuilder':
         """Filter by locality name."""
-        return self._add_tag('loc', location, quote=True)
     
+    @_tag('area', quote=True)
     def area(self, area: str) -> 'QueryBuilder':
         """
         Filter by continent or region.
@@ -102,7 +198,6 @@ class QueryBuilder:
         Args:
             area: e.g., 'africa', 'asia', 'europe', 'north america', etc.
         """
-        return self._add_tag('area', area, quote=True)
     
     def bounding_box(self, lat_min: float, lon_min: float, lat_max: float, lon_max: float) -> 'QueryBuilder':
         """
@@ -117,6 +212,7 @@ class QueryBuilder:
         box_value = f"{lat_min},{lon_min},{lat_max},{lon_max}"
         return self._add_tag('box', box_value)
     
+    @_tag('q')
     def quality(self, quality: str) -> 'QueryBuilder':
         """
         Filter by quality rating.
@@ -125,8 +221,8 @@ class QueryBuilder:
             quality: One of 'A', 'B', 'C', 'D', 'E', 'no score'
                     Can also use operators like 'A', '>B', etc.
         """
-        return self._add_tag('q', quality)
     
+    @_tag('type', quote=True)
     def sound_type(self, sound_type: str) -> 'QueryBuilder':
         """
         Filter by sound type.
@@ -134,8 +230,8 @@ class QueryBuilder:
         Args:
             sound_type: e.g., 'song', 'call', 'drumming', 'alarm call', etc.
         """
-        return self._add_tag('type', sound_type, quote=True)
     
+    @_tag('sex')
     def sex(self, sex: str) -> 'QueryBuilder':
         """
         Filter by sex of the recorded animal.
@@ -143,8 +239,8 @@ class QueryBuilder:
         Args:
             sex: e.g., 'male', 'female', 'uncertain'
         """
-        return self._add_tag('sex', sex)
     
+    @_tag('stage')
     def life_stage(self, stage: str) -> 'QueryBuilder':
         """
         Filter by life stage.
@@ -152,8 +248,8 @@ class QueryBuilder:
         Args:
             stage: e.g., 'adult', 'juvenile', 'subadult', etc.
         """
-        return self._add_tag('stage', stage)
     
+    @_tag('method', quote=True)
     def method(self, method: str) -> 'QueryBuilder':
         """
         Filter by recording method.
@@ -161,8 +257,8 @@ class QueryBuilder:
         Args:
             method: e.g., 'field recording', 'in the hand', etc.
         """
-        return self._add_tag('method', method, quote=True)
     
+    @_tag('len', quote=True)
     def length(self, length: str) -> 'QueryBuilder':
         """
         Filter by recording length.
@@ -170,8 +266,8 @@ class QueryBuilder:
         Args:
             length: e.g., '10-20', '<30', '>60' (in seconds)
         """
-        return self._add_tag('len', length, quote=True)
     
+    @_tag('year')
     def year(self, year: str) -> 'QueryBuilder':
         """
         Filter by recording year.
@@ -179,8 +275,8 @@ class QueryBuilder:
         Args:
             year: e.g., '2020', '2015-2020', '>2018'
         """
-        return self._add_tag('year', year)
     
+    @_tag('month')
     def month(self, month: str) -> 'QueryBuilder':
         """
         Filter by recording month.
@@ -188,7 +284,6 @@ class QueryBuilder:
         Args:
             month: e.g., '1', '6', '1-3' (1=January, 12=December)
         """
-        return self._add_tag('month', month)
     
     def since(self, days: int) -> 'QueryBuilder':
         """
@@ -199,6 +294,7 @@ class QueryBuilder:
         """
         return self._add_tag('since', str(days))
     
+    @_tag('uploaded')
     def uploaded(self, uploaded: str) -> 'QueryBuilder':
         """
         Filter by upload date.
@@ -206,8 +302,8 @@ class QueryBuilder:
         Args:
             uploaded: e.g., '2024', '2020-2024', '>2022'
         """
-        return self._add_tag('uploaded', uploaded)
     
+    @_tag('lic')
     def license(self, license_type: str) -> 'QueryBuilder':
         """
         Filter by license type.
@@ -215,11 +311,10 @@ class QueryBuilder:
         Args:
             license_type: e.g., 'cc', 'cc-by', 'cc-by-sa', etc.
         """
-        return self._add_tag('lic', license_type)
     
+    @_tag('also', quote=True)
     def also(self, species: str) -> 'QueryBuilder':
         """Filter by background species."""
-        return self._add_tag('also', species, quote=True)
     
     def animal_seen(self, seen: bool) -> 'QueryBuilder':
         """Filter by whether the animal was seen."""
@@ -231,6 +326,7 @@ class QueryBuilder:
         value = 'yes' if used else 'no'
         return self._add_tag('playback', value)
     
+    @_tag('time', quote=True)
     def time_of_day(self, time: str) -> 'QueryBuilder':
         """
         Filter by time of day.
@@ -238,8 +334,8 @@ class QueryBuilder:
         Args:
             time: Time in format 'HH:MM' or range like '06:00-12:00'
         """
-        return self._add_tag('time', time, quote=True)
     
+    @_tag('alt', quote=True)
     def altitude(self, altitude: str) -> 'QueryBuilder':
         """
         Filter by altitude in meters.
@@ -247,8 +343,8 @@ class QueryBuilder:
         Args:
             altitude: e.g., '100-500', '<1000', '>2000'
         """
-        return self._add_tag('alt', altitude, quote=True)
     
+    @_tag('lat', quote=True)
     def latitude(self, latitude: str) -> 'QueryBuilder':
         """
         Filter by latitude.
@@ -256,8 +352,8 @@ class QueryBuilder:
         Args:
             latitude: e.g., '40-45', '>50'
         """
-        return self._add_tag('lat', latitude, quote=True)
     
+    @_tag('lon', quote=True)
     def longitude(self, longitude: str) -> 'QueryBuilder':
         """
         Filter by longitude.
@@ -265,9 +361,9 @@ class QueryBuilder:
         Args:
             longitude: e.g., '-10-0', '<-100'
         """
-        return self._add_tag('lon', longitude, quote=True)
         
     
+    @_tag('nr')
     def xc_number(self, number: str) -> 'QueryBuilder':
         """
         Filter by xeno-canto catalogue number.
@@ -275,8 +371,8 @@ class QueryBuilder:
         Args:
             number: e.g., '12345', '>100000'
         """
-        return self._add_tag('nr', number)
     
+    @_tag('temp')
     def temperature(self, temp: str) -> 'QueryBuilder':
         """
         Filter by temperature during recording.
@@ -284,8 +380,8 @@ class QueryBuilder:
         Args:
             temp: e.g., '20-30', '<10', '>25'
         """
-        return self._add_tag('temp', temp)
     
+    @_tag('regnr', quote=True)
     def registration_number(self, regnr: str) -> 'QueryBuilder':
         """
         Filter by specimen registration number.
@@ -293,8 +389,8 @@ class QueryBuilder:
         Args:
             regnr: Registration number when specimen was collected
         """
-        return self._add_tag('regnr', regnr, quote=True)
     
+    @_tag('auto')
     def automatic_recording(self, is_auto: str) -> 'QueryBuilder':
         """
         Filter by whether recording was automatic (non-supervised).
@@ -302,8 +398,8 @@ class QueryBuilder:
         Args:
             is_auto: 'yes', 'no', or 'unknown'
         """
-        return self._add_tag('auto', is_auto)
     
+    @_tag('dvc', quote=True)
     def device(self, device: str) -> 'QueryBuilder':
         """
         Filter by recording device used.
@@ -311,8 +407,8 @@ class QueryBuilder:
         Args:
             device: Name or model of recording device
         """
-        return self._add_tag('dvc', device, quote=True)
     
+    @_tag('mic', quote=True)
     def microphone(self, microphone: str) -> 'QueryBuilder':
         """
         Filter by microphone used.
@@ -320,8 +416,8 @@ class QueryBuilder:
         Args:
             microphone: Name or model of microphone
         """
-        return self._add_tag('mic', microphone, quote=True)
     
+    @_tag('smp')
     def sample_rate(self, rate: str) -> 'QueryBuilder':
         """
         Filter by sample rate.
@@ -329,8 +425,8 @@ class QueryBuilder:
         Args:
             rate: e.g., '44100', '48000', '>44100'
         """
-        return self._add_tag('smp', rate)
     
+    @_tag('rmk', quote=True)
     def remarks(self, remarks: str) -> 'QueryBuilder':
         """
         Filter by remarks text.
@@ -338,16 +434,19 @@ class QueryBuilder:
         Args:
             remarks: Search in recordist's remarks field
         """
-        return self._add_tag('rmk', remarks, quote=True)
     
     def build(self) -> str:
         """
         Build and return the final query string.
         
+        The result is cached until another tag is added.
+        
         Returns:
             A query string suitable for the Xeno-canto API
         """
-        return ' '.join(self._tags) if self._tags else ''
+        if self._built is None:
+            self._built = ' '.join(self._tags)
+        return self._built
     
     def __str__(self) -> str:
         """Return the query string."""